@@ -8,10 +8,160 @@ Provides:
 - Fit score correlations
 - Application success predictions
 """
+import os
+import sys
+import json
+import time
 import sqlite3
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from database import get_connection, DB_FILE
+from collections import defaultdict
+from typing import Dict, List, Optional
+from database import get_read_connection
+
+
+# ============================================
+# SQL
+# ============================================
+
+# Fit score buckets as (minimum score, label), highest first; the last
+# entry catches everything below (including unscored dogs).
+FIT_SCORE_BUCKETS = (
+  (7, 'High (7+)'),
+  (5, 'Medium (5-6)'),
+  (None, 'Low (<5)'),
+)
+
+_FIT_BUCKET_CASE = "CASE {} ELSE '{}' END".format(
+  " ".join(f"WHEN fit_score >= {low} THEN '{label}'" for low, label in FIT_SCORE_BUCKETS[:-1]),
+  FIT_SCORE_BUCKETS[-1][1],
+)
+
+# Per-connection view mapping each dog to its fit bucket
+_Q_FIT_BUCKETS_VIEW = f"""
+  CREATE TEMP VIEW IF NOT EXISTS fit_buckets(dog_id, bucket) AS
+  SELECT dog_id, {_FIT_BUCKET_CASE} FROM dogs
+"""
+
+# One pass over the filtered join: overall, by rescue and by fit score
+# rows come back tagged by `grp`. The overall figure uses a LEFT JOIN so
+# history rows for unknown dogs still count.
+_Q_ADOPTION_STATS = """
+  WITH pending AS (
+    SELECT d.dog_id, d.rescue_name, b.bucket,
+           sh.days_in_previous_status AS days
+    FROM status_history sh
+    LEFT JOIN dogs d ON sh.dog_id = d.dog_id
+    LEFT JOIN fit_buckets b ON sh.dog_id = b.dog_id
+    WHERE sh.status = 'Pending' AND sh.days_in_previous_status IS NOT NULL
+  )
+  SELECT 'all' as grp, NULL as bucket, AVG(days) as avg_days, COUNT(*) as count
+  FROM pending
+  UNION ALL
+  SELECT 'rescue', rescue_name, AVG(days), COUNT(*)
+  FROM pending
+  WHERE dog_id IS NOT NULL
+  GROUP BY rescue_name
+  UNION ALL
+  SELECT 'fit', bucket, AVG(days), COUNT(*)
+  FROM pending
+  WHERE dog_id IS NOT NULL
+  GROUP BY bucket
+"""
+
+_Q_DOG_BY_ID = "SELECT * FROM dogs WHERE dog_id = ?"
+
+_Q_SIMILAR_DOGS = """
+  SELECT AVG(sh.days_in_previous_status) as avg_days, COUNT(*) as n
+  FROM status_history sh
+  JOIN dogs d ON sh.dog_id = d.dog_id
+  WHERE sh.status IN ('Pending', 'Adopted/Removed')
+    AND sh.days_in_previous_status IS NOT NULL
+    AND d.rescue_name = ?
+    AND d.fit_score BETWEEN ? AND ?
+"""
+
+_Q_HISTORY_BY_RESCUE_FIT = """
+  SELECT d.rescue_name, d.fit_score,
+    SUM(sh.days_in_previous_status) as total_days, COUNT(*) as n
+  FROM status_history sh
+  JOIN dogs d ON sh.dog_id = d.dog_id
+  WHERE sh.status IN ('Pending', 'Adopted/Removed')
+    AND sh.days_in_previous_status IS NOT NULL
+    AND d.fit_score IS NOT NULL
+  GROUP BY d.rescue_name, d.fit_score
+"""
+
+# Format with placeholders="?,?,..." (one per dog_id)
+_Q_DOGS_BY_IDS = """
+  SELECT dog_id, rescue_name, fit_score FROM dogs
+  WHERE dog_id IN ({placeholders})
+"""
+
+_Q_TRANSITIONS = """
+  WITH transitions AS (
+    SELECT 
+      LAG(status) OVER (PARTITION BY dog_id ORDER BY timestamp) as from_status,
+      status as to_status,
+      days_in_previous_status as days
+    FROM status_history
+    WHERE days_in_previous_status IS NOT NULL
+  )
+  SELECT from_status, to_status,
+    ROUND(AVG(days), 1) as avg_days,
+    MIN(days) as min_days,
+    MAX(days) as max_days,
+    COUNT(*) as count
+  FROM transitions
+  WHERE from_status IS NOT NULL AND from_status != ''
+  GROUP BY from_status, to_status
+  ORDER BY from_status, to_status
+"""
+
+_Q_RESCUE_PERFORMANCE = """
+  SELECT 
+    rescue_name,
+    COUNT(*) as total_dogs,
+    ROUND(COALESCE(AVG(fit_score), 0), 1) as avg_fit_score,
+    COUNT(*) FILTER (WHERE status = 'Available') as available,
+    COUNT(*) FILTER (WHERE status = 'Pending') as pending,
+    COUNT(*) FILTER (WHERE status = 'Upcoming') as upcoming,
+    COUNT(*) FILTER (WHERE is_active = 0) as adopted
+  FROM dogs
+  GROUP BY rescue_name
+"""
+
+# Fingerprint of the data the report depends on: status_history growth, plus
+# dog counts and fit-score totals per (rescue, status, active, fit bucket), so
+# a rescore or status change invalidates the snapshot
+_Q_SNAPSHOT_KEY = f"""
+  SELECT
+    (SELECT COUNT(*) || '|' || IFNULL(MAX(timestamp), '') FROM status_history),
+    (SELECT GROUP_CONCAT(sig, ';') FROM (
+      SELECT IFNULL(rescue_name, '') || '|' || IFNULL(status, '') || '|' ||
+             IFNULL(is_active, '') || '|' || {_FIT_BUCKET_CASE} || '|' ||
+             COUNT(*) || '|' || TOTAL(fit_score) AS sig
+      FROM dogs
+      GROUP BY rescue_name, status, is_active, {_FIT_BUCKET_CASE}
+      ORDER BY sig
+    ))
+"""
+
+# On-disk snapshot cache
+ANALYTICS_CACHE_FILE = os.path.join(
+  os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+  "dog-rescue-tracker",
+  "analytics.json"
+)
+ANALYTICS_CACHE_TTL = 3600  # seconds
+
+
+def _tuple_cursor() -> sqlite3.Cursor:
+  """
+  Cursor on the shared read connection that yields plain tuples.
+  Aggregation loops unpack rows positionally, so skip sqlite3.Row.
+  """
+  cursor = get_read_connection().cursor()
+  cursor.row_factory = None
+  return cursor
 
 
 def get_adoption_stats() -> Dict:
@@ -24,49 +174,25 @@ def get_adoption_stats() -> Dict:
     - by_rescue: Stats broken down by rescue
     - by_fit_score: Stats broken down by fit score ranges
   """
-  conn = get_connection()
-  cursor = conn.cursor()
-  
-  # Overall time to pending
-  cursor.execute("""
-    SELECT AVG(days_in_previous_status) as avg_days
-    FROM status_history
-    WHERE status = 'Pending' AND days_in_previous_status IS NOT NULL
-  """)
-  row = cursor.fetchone()
-  avg_to_pending = row['avg_days'] if row else None
-  
-  # By rescue
-  cursor.execute("""
-    SELECT d.rescue_name, AVG(sh.days_in_previous_status) as avg_days
-    FROM status_history sh
-    JOIN dogs d ON sh.dog_id = d.dog_id
-    WHERE sh.status = 'Pending' AND sh.days_in_previous_status IS NOT NULL
-    GROUP BY d.rescue_name
-  """)
-  by_rescue = {row['rescue_name']: row['avg_days'] for row in cursor.fetchall()}
-  
-  # By fit score range
-  cursor.execute("""
-    SELECT 
-      CASE 
-        WHEN d.fit_score >= 7 THEN 'High (7+)'
-        WHEN d.fit_score >= 5 THEN 'Medium (5-6)'
-        ELSE 'Low (<5)'
-      END as score_range,
-      AVG(sh.days_in_previous_status) as avg_days,
-      COUNT(*) as count
-    FROM status_history sh
-    JOIN dogs d ON sh.dog_id = d.dog_id
-    WHERE sh.status = 'Pending' AND sh.days_in_previous_status IS NOT NULL
-    GROUP BY score_range
-  """)
-  by_fit_score = {row['score_range']: {
-    'avg_days': row['avg_days'],
-    'count': row['count']
-  } for row in cursor.fetchall()}
-  
-  conn.close()
+  cursor = _tuple_cursor()
+  cursor.execute(_Q_FIT_BUCKETS_VIEW)
+  
+  # Overall, by-rescue and by-fit-score rows in one pass, split by `grp`
+  cursor.execute(_Q_ADOPTION_STATS)
+  
+  avg_to_pending = None
+  by_rescue = {}
+  by_fit_score = {}
+  for grp, bucket, avg_days, count in cursor:
+    if grp == 'all':
+      avg_to_pending = avg_days
+    elif grp == 'rescue':
+      by_rescue[bucket] = avg_days
+    else:
+      by_fit_score[bucket] = {
+        'avg_days': avg_days,
+        'count': count
+      }
   
   return {
     'avg_days_to_pending': avg_to_pending,
@@ -85,33 +211,65 @@ def predict_time_to_adoption(dog_id: str) -> Optional[Dict]:
     - confidence: low/medium/high
     - similar_dogs: Number of similar dogs used for prediction
   """
-  conn = get_connection()
+  conn = get_read_connection()
   cursor = conn.cursor()
   
   # Get dog info
-  cursor.execute("SELECT * FROM dogs WHERE dog_id = ?", (dog_id,))
+  cursor.execute(_Q_DOG_BY_ID, (dog_id,))
   dog = cursor.fetchone()
   if not dog:
-    conn.close()
     return None
   
   dog = dict(dog)
   
-  # Find similar dogs (same rescue, similar fit score)
-  cursor.execute("""
-    SELECT sh.days_in_previous_status
-    FROM status_history sh
-    JOIN dogs d ON sh.dog_id = d.dog_id
-    WHERE sh.status IN ('Pending', 'Adopted/Removed')
-      AND sh.days_in_previous_status IS NOT NULL
-      AND d.rescue_name = ?
-      AND d.fit_score BETWEEN ? AND ?
-  """, (dog['rescue_name'], (dog['fit_score'] or 0) - 2, (dog['fit_score'] or 0) + 2))
+  # Aggregate similar dogs (same rescue, similar fit score) in SQL
+  fit = dog['fit_score'] or 0
+  cursor.execute(_Q_SIMILAR_DOGS, (dog['rescue_name'], fit - 2, fit + 2))
+  
+  row = cursor.fetchone()
   
-  similar = [row['days_in_previous_status'] for row in cursor.fetchall()]
-  conn.close()
+  return _build_prediction(row['avg_days'], row['n'])
+
+
+def predict_time_to_adoption_bulk(dog_ids: List[str]) -> Dict[str, Optional[Dict]]:
+  """
+  Predict time to adoption for many dogs at once
   
-  if not similar:
+  Same result per dog as predict_time_to_adoption, but issues two queries
+  in total instead of two per dog. Unknown dog_ids map to None.
+  """
+  predictions = {dog_id: None for dog_id in dog_ids}
+  if not dog_ids:
+    return predictions
+  
+  cursor = _tuple_cursor()
+  
+  # Historical sums/counts per (rescue, fit score)
+  cursor.execute(_Q_HISTORY_BY_RESCUE_FIT)
+  history = defaultdict(list)
+  for rescue_name, fit_score, total_days, n in cursor:
+    history[rescue_name].append((fit_score, total_days, n))
+  
+  placeholders = ",".join("?" * len(dog_ids))
+  cursor.execute(_Q_DOGS_BY_IDS.format(placeholders=placeholders), list(dog_ids))
+  
+  for dog_id, rescue_name, fit in cursor:
+    fit = fit or 0
+    total_days = 0
+    similar_count = 0
+    for fit_score, days, n in history.get(rescue_name, []):
+      if fit - 2 <= fit_score <= fit + 2:
+        total_days += days
+        similar_count += n
+    avg_days = total_days / similar_count if similar_count else None
+    predictions[dog_id] = _build_prediction(avg_days, similar_count)
+  
+  return predictions
+
+
+def _build_prediction(avg_days: Optional[float], similar_count: int) -> Dict:
+  """Turn an average and sample size into a prediction dict"""
+  if not similar_count:
     return {
       'predicted_days': None,
       'confidence': 'low',
@@ -119,12 +277,10 @@ def predict_time_to_adoption(dog_id: str) -> Optional[Dict]:
       'message': 'Not enough historical data'
     }
   
-  avg_days = sum(similar) / len(similar)
-  
   # Confidence based on sample size
-  if len(similar) >= 10:
+  if similar_count >= 10:
     confidence = 'high'
-  elif len(similar) >= 5:
+  elif similar_count >= 5:
     confidence = 'medium'
   else:
     confidence = 'low'
@@ -132,8 +288,8 @@ def predict_time_to_adoption(dog_id: str) -> Optional[Dict]:
   return {
     'predicted_days': round(avg_days, 1),
     'confidence': confidence,
-    'similar_dogs': len(similar),
-    'message': f'Based on {len(similar)} similar dogs'
+    'similar_dogs': similar_count,
+    'message': f'Based on {similar_count} similar dogs'
   }
 
 
@@ -146,38 +302,19 @@ def get_status_progression_analysis() -> Dict:
     - Available -> Pending: X days average
     - Pending -> Adopted: X days average
   """
-  conn = get_connection()
-  cursor = conn.cursor()
+  cursor = _tuple_cursor()
   
   progressions = {}
   
-  # Get transitions
-  cursor.execute("""
-    SELECT 
-      LAG(status) OVER (PARTITION BY dog_id ORDER BY timestamp) as from_status,
-      status as to_status,
-      days_in_previous_status
-    FROM status_history
-    WHERE days_in_previous_status IS NOT NULL
-  """)
-  
-  transitions = {}
-  for row in cursor.fetchall():
-    if row['from_status']:
-      key = f"{row['from_status']} -> {row['to_status']}"
-      if key not in transitions:
-        transitions[key] = []
-      transitions[key].append(row['days_in_previous_status'])
-  
-  conn.close()
-  
-  # Calculate averages
-  for transition, days_list in transitions.items():
-    progressions[transition] = {
-      'avg_days': round(sum(days_list) / len(days_list), 1),
-      'min_days': min(days_list),
-      'max_days': max(days_list),
-      'count': len(days_list)
+  # Aggregate transitions per (from, to) pair in SQL
+  cursor.execute(_Q_TRANSITIONS)
+  
+  for from_status, to_status, avg_days, min_days, max_days, count in cursor:
+    progressions[f"{from_status} -> {to_status}"] = {
+      'avg_days': avg_days,
+      'min_days': min_days,
+      'max_days': max_days,
+      'count': count
     }
   
   return progressions
@@ -186,45 +323,42 @@ def get_status_progression_analysis() -> Dict:
 def get_rescue_performance() -> Dict:
   """
   Compare rescue organizations by various metrics
+  (uses aggregate FILTER clauses, requires SQLite 3.30+)
   """
-  conn = get_connection()
-  cursor = conn.cursor()
+  cursor = _tuple_cursor()
   
   performance = {}
   
-  cursor.execute("""
-    SELECT 
-      rescue_name,
-      COUNT(*) as total_dogs,
-      AVG(fit_score) as avg_fit_score,
-      SUM(CASE WHEN status = 'Available' THEN 1 ELSE 0 END) as available,
-      SUM(CASE WHEN status = 'Pending' THEN 1 ELSE 0 END) as pending,
-      SUM(CASE WHEN status = 'Upcoming' THEN 1 ELSE 0 END) as upcoming,
-      SUM(CASE WHEN is_active = 0 THEN 1 ELSE 0 END) as adopted
-    FROM dogs
-    GROUP BY rescue_name
-  """)
-  
-  for row in cursor.fetchall():
-    performance[row['rescue_name']] = {
-      'total_dogs': row['total_dogs'],
-      'avg_fit_score': round(row['avg_fit_score'] or 0, 1),
-      'available': row['available'],
-      'pending': row['pending'],
-      'upcoming': row['upcoming'],
-      'adopted': row['adopted']
+  cursor.execute(_Q_RESCUE_PERFORMANCE)
+  
+  for rescue_name, total_dogs, avg_fit_score, available, pending, upcoming, adopted in cursor:
+    performance[rescue_name] = {
+      'total_dogs': total_dogs,
+      'avg_fit_score': avg_fit_score,
+      'available': available,
+      'pending': pending,
+      'upcoming': upcoming,
+      'adopted': adopted
     }
   
-  conn.close()
   return performance
 
 
-def get_application_insights(your_fit_preferences: Dict = None) -> Dict:
+def get_application_insights(
+  your_fit_preferences: Dict = None,
+  *,
+  stats: Optional[Dict] = None,
+  progressions: Optional[Dict] = None,
+  rescue_perf: Optional[Dict] = None
+) -> Dict:
   """
   Insights to help with adoption application strategy
   
   Args:
     your_fit_preferences: Dict of your preferences to match against
+    stats: Precomputed get_adoption_stats() result (queried if omitted)
+    progressions: Precomputed get_status_progression_analysis() result
+    rescue_perf: Precomputed get_rescue_performance() result
     
   Returns:
     Recommendations for application timing and approach
@@ -235,8 +369,12 @@ def get_application_insights(your_fit_preferences: Dict = None) -> Dict:
     'recommendations': []
   }
   
-  stats = get_adoption_stats()
-  progressions = get_status_progression_analysis()
+  if stats is None:
+    stats = get_adoption_stats()
+  if progressions is None:
+    progressions = get_status_progression_analysis()
+  if rescue_perf is None:
+    rescue_perf = get_rescue_performance()
   
   # Analyze competition (how fast dogs go pending)
   avg_to_pending = stats.get('avg_days_to_pending')
@@ -259,14 +397,13 @@ def get_application_insights(your_fit_preferences: Dict = None) -> Dict:
   
   # Fit score insights
   by_fit = stats.get('by_fit_score', {})
-  high_fit = by_fit.get('High (7+)', {})
+  high_fit = by_fit.get(FIT_SCORE_BUCKETS[0][1], {})
   if high_fit.get('avg_days'):
     insights['recommendations'].append(
       f"⭐ High-fit dogs (7+) go pending in ~{high_fit['avg_days']:.0f} days on average."
     )
   
   # Rescue-specific insights
-  rescue_perf = get_rescue_performance()
   for rescue, perf in rescue_perf.items():
     if perf['available'] > 3:
       insights['recommendations'].append(
@@ -276,52 +413,148 @@ def get_application_insights(your_fit_preferences: Dict = None) -> Dict:
   return insights
 
 
+def _snapshot_key() -> List:
+  """Fingerprint of the tables the snapshot is built from"""
+  cursor = _tuple_cursor()
+  cursor.execute(_Q_SNAPSHOT_KEY)
+  return list(cursor.fetchone())
+
+
+def _snapshot_to_json(snapshot: Dict) -> Dict:
+  """
+  On-disk form of a snapshot: rescue-keyed dicts become [key, value] pairs
+  so a None rescue name survives the round trip (JSON keys are strings)
+  """
+  stats = snapshot['adoption_stats']
+  return dict(
+    snapshot,
+    adoption_stats=dict(stats, by_rescue=list(stats['by_rescue'].items())),
+    rescue_performance=list(snapshot['rescue_performance'].items())
+  )
+
+
+def _snapshot_from_json(data: Dict) -> Dict:
+  """Inverse of _snapshot_to_json"""
+  stats = data['adoption_stats']
+  return dict(
+    data,
+    adoption_stats=dict(stats, by_rescue=dict(map(tuple, stats['by_rescue']))),
+    rescue_performance=dict(map(tuple, data['rescue_performance']))
+  )
+
+
+def compute_analytics_snapshot(use_cache: bool = False) -> Dict:
+  """
+  Run all report queries once and return a JSON-serializable dict
+  
+  With use_cache (opt-in), a snapshot saved within ANALYTICS_CACHE_TTL whose
+  key still matches the database is returned without re-running the queries.
+  
+  Returns dict with:
+    - key / created_at: cache bookkeeping
+    - adoption_stats, progressions, rescue_performance, insights
+  """
+  key = _snapshot_key()
+  
+  if use_cache and os.path.exists(ANALYTICS_CACHE_FILE):
+    try:
+      with open(ANALYTICS_CACHE_FILE, 'r') as f:
+        cached = json.load(f)
+      if cached.get('key') == key and time.time() - cached.get('created_at', 0) < ANALYTICS_CACHE_TTL:
+        return _snapshot_from_json(cached)
+    except Exception as e:
+      print(f"⚠️ Error loading analytics cache: {e}")
+  
+  # Each aggregation runs once; insights reuse the results instead of re-querying
+  stats = get_adoption_stats()
+  progressions = get_status_progression_analysis()
+  performance = get_rescue_performance()
+  
+  snapshot = {
+    'key': key,
+    'created_at': time.time(),
+    'adoption_stats': stats,
+    'progressions': progressions,
+    'rescue_performance': performance,
+    'insights': get_application_insights(
+      stats=stats,
+      progressions=progressions,
+      rescue_perf=performance
+    ),
+  }
+  
+  if use_cache:
+    try:
+      os.makedirs(os.path.dirname(ANALYTICS_CACHE_FILE), exist_ok=True)
+      with open(ANALYTICS_CACHE_FILE, 'w') as f:
+        json.dump(_snapshot_to_json(snapshot), f)
+    except Exception as e:
+      print(f"⚠️ Error saving analytics cache: {e}")
+  
+  return snapshot
+
+
+def invalidate_analytics_snapshot():
+  """Delete the on-disk snapshot (called after scrapes write new data)"""
+  try:
+    os.remove(ANALYTICS_CACHE_FILE)
+  except FileNotFoundError:
+    pass
+
+
 def print_analytics_report():
   """Print a formatted analytics report"""
-  print("\n" + "=" * 60)
-  print("📊 DOG RESCUE ANALYTICS REPORT")
-  print("=" * 60)
+  snapshot = compute_analytics_snapshot(use_cache=False)  # always report current data
+  
+  # Collect lines and write once at the end
+  out = []
+  
+  out.append("\n" + "=" * 60)
+  out.append("📊 DOG RESCUE ANALYTICS REPORT")
+  out.append("=" * 60)
   
   # Adoption stats
-  stats = get_adoption_stats()
-  print("\n📈 ADOPTION TIMING")
-  print("-" * 40)
+  stats = snapshot['adoption_stats']
+  out.append("\n📈 ADOPTION TIMING")
+  out.append("-" * 40)
   if stats['avg_days_to_pending']:
-    print(f"  Average days to Pending: {stats['avg_days_to_pending']:.1f}")
+    out.append(f"  Average days to Pending: {stats['avg_days_to_pending']:.1f}")
   
-  print("\n  By Rescue:")
+  out.append("\n  By Rescue:")
   for rescue, days in stats.get('by_rescue', {}).items():
-    print(f"    {rescue}: {days:.1f} days avg")
+    out.append(f"    {rescue}: {days:.1f} days avg")
   
-  print("\n  By Fit Score:")
+  out.append("\n  By Fit Score:")
   for score_range, data in stats.get('by_fit_score', {}).items():
-    print(f"    {score_range}: {data['avg_days']:.1f} days avg ({data['count']} dogs)")
+    out.append(f"    {score_range}: {data['avg_days']:.1f} days avg ({data['count']} dogs)")
   
   # Status progression
-  print("\n🔄 STATUS PROGRESSION")
-  print("-" * 40)
-  progressions = get_status_progression_analysis()
+  out.append("\n🔄 STATUS PROGRESSION")
+  out.append("-" * 40)
+  progressions = snapshot['progressions']
   for transition, data in progressions.items():
-    print(f"  {transition}:")
-    print(f"    Avg: {data['avg_days']} days | Range: {data['min_days']}-{data['max_days']} | n={data['count']}")
+    out.append(f"  {transition}:")
+    out.append(f"    Avg: {data['avg_days']} days | Range: {data['min_days']}-{data['max_days']} | n={data['count']}")
   
   # Rescue performance
-  print("\n🏆 RESCUE PERFORMANCE")
-  print("-" * 40)
-  performance = get_rescue_performance()
+  out.append("\n🏆 RESCUE PERFORMANCE")
+  out.append("-" * 40)
+  performance = snapshot['rescue_performance']
   for rescue, perf in performance.items():
-    print(f"\n  {rescue}:")
-    print(f"    Total: {perf['total_dogs']} | Avg Fit: {perf['avg_fit_score']}")
-    print(f"    Available: {perf['available']} | Pending: {perf['pending']} | Upcoming: {perf['upcoming']}")
+    out.append(f"\n  {rescue}:")
+    out.append(f"    Total: {perf['total_dogs']} | Avg Fit: {perf['avg_fit_score']}")
+    out.append(f"    Available: {perf['available']} | Pending: {perf['pending']} | Upcoming: {perf['upcoming']}")
   
   # Application insights
-  print("\n💡 APPLICATION INSIGHTS")
-  print("-" * 40)
-  insights = get_application_insights()
-  print(f"  Competition Level: {insights.get('competition_level', 'Unknown')}")
-  print("\n  Recommendations:")
+  out.append("\n💡 APPLICATION INSIGHTS")
+  out.append("-" * 40)
+  insights = snapshot['insights']
+  out.append(f"  Competition Level: {insights.get('competition_level', 'Unknown')}")
+  out.append("\n  Recommendations:")
   for rec in insights.get('recommendations', []):
-    print(f"    {rec}")
+    out.append(f"    {rec}")
+  
+  sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
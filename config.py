@@ -1,6 +1,7 @@
 """
 Configuration for dog rescue scraper
 """
+from types import MappingProxyType
 
 # Database configuration
 DB_PATH = "dogs.db"
@@ -44,7 +45,7 @@ RESCUES = {
 }
 
 # Watch list dogs (names to flag for close monitoring)
-WATCH_LIST_DOGS = [
+WATCH_LIST_DOGS = frozenset({
   "Drizzle",
   "Kru",
   "Nimbi",
@@ -53,7 +54,7 @@ WATCH_LIST_DOGS = [
   "Skipper",
   "Freddy Faz",
   "Freddy Fax",  # In case of typo variations
-]
+})
 
 # Fit Score weights
 # NOTE: Since these are doodle-specific rescues, most dogs will be low-shedding
@@ -92,5 +93,13 @@ SCORING_WEIGHTS = {
   "pending_penalty": -2
 }
 
+# Freeze read-only config so it can't be mutated at runtime
+RESCUES = MappingProxyType({key: MappingProxyType(value) for key, value in RESCUES.items()})
+
+SCORING_WEIGHTS = MappingProxyType({
+  key: MappingProxyType(value) if isinstance(value, dict) else value
+  for key, value in SCORING_WEIGHTS.items()
+})
+
 # User agent for web requests
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
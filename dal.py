@@ -22,10 +22,20 @@ Usage:
 """
 import sqlite3
 import json
+import hashlib
 import os
-from typing import List, Optional, Dict, Any, Tuple
+import re
+import atexit
+import threading
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
 
 from schema import (
   Dog, DogImage, RescueMeta,
@@ -36,6 +46,206 @@ from schema import (
   get_current_timestamp,
 )
 
+# Bump when init_database() gains a migration (stored in PRAGMA user_version)
+SCHEMA_VERSION = 3
+
+# Fields compared on update to generate change events
+TRACKED_FIELDS = (
+  'status', 'weight', 'shedding', 'energy_level',
+  'good_with_kids', 'good_with_dogs', 'good_with_cats',
+  'special_needs', 'adoption_fee', 'fit_score'
+)
+
+# Scraped columns the UPSERT refreshes, in the order _content_values() returns them
+CONTENT_FIELDS = (
+  'dog_name', 'rescue_name', 'breed', 'weight', 'age_range',
+  'sex', 'shedding', 'energy_level',
+  'good_with_kids', 'good_with_dogs', 'good_with_cats',
+  'special_needs', 'adoption_fee', 'platform', 'location', 'status',
+  'notes', 'adoption_req', 'source_url', 'image_url', 'fit_score'
+)
+
+# Stored columns read before saving an existing dog
+PROBE_FIELDS = tuple(dict.fromkeys(TRACKED_FIELDS + CONTENT_FIELDS)) + ('is_active', 'rescue_meta_hash')
+
+# Insert a dog, or refresh the scraped columns if it already exists.
+# First-seen/status-changed dates and watch_list are only set on insert.
+UPSERT_DOG_SQL = """
+  INSERT INTO dogs (
+    dog_id, dog_name, rescue_name, breed, weight, age_range,
+    sex, shedding, energy_level, good_with_kids, good_with_dogs, good_with_cats,
+    special_needs, adoption_fee, platform, location, status, notes, adoption_req,
+    source_url, image_url, fit_score, age_category, watch_list, date_first_seen,
+    date_last_updated, date_status_changed, is_active, rescue_meta_json, rescue_meta_hash
+  ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+  ON CONFLICT(dog_id) DO UPDATE SET
+    dog_name = excluded.dog_name, rescue_name = excluded.rescue_name,
+    breed = excluded.breed, weight = excluded.weight,
+    age_range = excluded.age_range, sex = excluded.sex,
+    shedding = excluded.shedding, energy_level = excluded.energy_level,
+    good_with_kids = excluded.good_with_kids, good_with_dogs = excluded.good_with_dogs,
+    good_with_cats = excluded.good_with_cats, special_needs = excluded.special_needs,
+    adoption_fee = excluded.adoption_fee, platform = excluded.platform,
+    location = excluded.location, status = excluded.status, notes = excluded.notes,
+    adoption_req = excluded.adoption_req, source_url = excluded.source_url, image_url = excluded.image_url,
+    fit_score = excluded.fit_score, date_last_updated = excluded.date_last_updated,
+    is_active = 1,
+    -- Unchanged payload (same hash): keep the stored JSON, nothing was serialized
+    rescue_meta_json = CASE WHEN dogs.rescue_meta_hash IS excluded.rescue_meta_hash
+      THEN dogs.rescue_meta_json ELSE excluded.rescue_meta_json END,
+    rescue_meta_hash = excluded.rescue_meta_hash
+"""
+
+# Images live in dog_images (one row per image, idx = display order)
+DELETE_IMAGES_SQL = "DELETE FROM dog_images WHERE dog_id = ?"
+INSERT_IMAGE_SQL = """
+  INSERT INTO dog_images (dog_id, idx, url, source, priority, caption, added_at)
+  VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_IMAGES_SQL = """
+  SELECT url, source, priority, caption, added_at FROM dog_images
+  WHERE dog_id = ? ORDER BY idx
+"""
+
+# Existing dog with nothing new: only record that it was seen
+TOUCH_DOG_SQL = "UPDATE dogs SET date_last_updated = ? WHERE dog_id = ?"
+
+# Every column of the dogs table (used to validate caller-supplied column lists)
+DOG_COLUMNS = frozenset((
+  "dog_id", "dog_name", "rescue_name", "breed", "weight", "age_range",
+  "age_category", "age_years_min", "age_years_max", "age_is_range", "age_score",
+  "sex", "shedding", "energy_level", "good_with_kids", "good_with_dogs",
+  "good_with_cats", "training_level", "training_notes", "special_needs",
+  "health_notes", "adoption_req", "adoption_fee", "platform", "location",
+  "status", "notes", "source_url", "image_url", "fit_score", "watch_list",
+  "date_first_seen", "date_last_updated", "date_status_changed",
+  "date_went_pending", "date_went_unavailable", "is_active",
+  "rescue_meta_json", "images_json", "rescue_meta_hash",
+))
+
+# Columns returned by get_dogs_summary(), in tuple order
+SUMMARY_COLUMNS = ("dog_id", "dog_name", "rescue_name", "status", "fit_score", "is_active")
+
+INSERT_EVENT_SQL = """
+  INSERT OR REPLACE INTO dog_events (
+    event_id, dog_id, event_type, timestamp, source, summary,
+    field_changed, old_value, new_value, details_json, created_by
+  ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_CHANGE_SQL = """
+  INSERT INTO changes (dog_id, dog_name, field_changed, old_value, new_value, change_type, timestamp)
+  VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Single-column indexes superseded by the composite indexes in init_database()
+OBSOLETE_INDEXES = ("idx_dogs_status", "idx_dogs_rescue", "idx_dogs_fit", "idx_dogs_active", "idx_events_dog")
+
+# Age string parsing (see _parse_age_to_years)
+_DASH_TABLE = str.maketrans({"–": "-", "—": "-"})
+_AGE_RANGE_RE = re.compile(r"(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\s*(yr|year|mo|month)")
+_AGE_SINGLE_RE = re.compile(r"(\d+\.?\d*)\s*(yr|year|mo|month|wk|week)")
+
+
+def _json_loads(raw: bytes) -> Any:
+  """Parse JSON bytes, using orjson when it is installed"""
+  if orjson is not None:
+    return orjson.loads(raw)
+  return json.loads(raw)
+
+
+def _json_dumps_pretty(data: Any) -> bytes:
+  """Serialize to indented JSON bytes, using orjson when it is installed"""
+  if orjson is not None:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+  return json.dumps(data, indent=2).encode("utf-8")
+
+
+# Per-connection tuning applied by DAL._get_connection
+CONNECTION_PRAGMAS = (
+  "PRAGMA synchronous=NORMAL",
+  "PRAGMA temp_store=MEMORY",
+  "PRAGMA cache_size=-65536",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_age_to_years(age_str: Optional[str]) -> Optional[float]:
+  """Parse age string to years (pure, so memoized on the string)"""
+  if not age_str:
+    return None
+  
+  age_str = age_str.lower().translate(_DASH_TABLE)
+  
+  # Range: "1-3 yrs"
+  match = _AGE_RANGE_RE.search(age_str)
+  if match:
+    min_val = float(match.group(1))
+    max_val = float(match.group(2))
+    unit = match.group(3)
+    if unit.startswith("mo"):
+      min_val /= 12
+      max_val /= 12
+    return (min_val + max_val) / 2
+  
+  # Single: "2 yrs" or "8 mos"
+  match = _AGE_SINGLE_RE.search(age_str)
+  if match:
+    val = float(match.group(1))
+    unit = match.group(2)
+    if unit.startswith("mo"):
+      val /= 12
+    elif unit.startswith("wk") or unit.startswith("week"):
+      val /= 52
+    return val
+  
+  return None
+
+
+def _content_values(dog: Dog) -> Tuple:
+  """Values written to CONTENT_FIELDS for a dog, in the same order"""
+  return (
+    dog.dog_name, dog.rescue_name, dog.breed,
+    dog.effective_weight, dog.effective_age,
+    dog.sex, dog.shedding, dog.energy_level,
+    dog.good_with_kids, dog.good_with_dogs, dog.good_with_cats,
+    dog.special_needs_label,
+    dog.adoption_fee, dog.platform, dog.location, dog.status,
+    dog.rescue_meta.bio_text if dog.rescue_meta else "",
+    dog.rescue_meta.adoption_requirements_text if dog.rescue_meta else "",
+    dog.effective_source_url, dog.effective_image_url,
+    dog.effective_base_score,
+  )
+
+
+def _payload_hash(dog: Dog) -> str:
+  """
+  Stable fingerprint of rescue_meta and images.
+  Dataclass repr is much cheaper than to_dict() + json.dumps.
+  """
+  payload = repr((dog.rescue_meta, dog.images)).encode("utf-8")
+  return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+_LOW_MED_ENERGY = frozenset(("low", "medium"))
+
+
+def _shedding_points(config: ScoringConfig) -> Dict[str, int]:
+  """Lowercased shedding level -> points under a scoring config"""
+  return {
+    "none": config.shedding_none,
+    "low": config.shedding_low,
+    "high": config.shedding_high,
+    "unknown": config.shedding_unknown,
+  }
+
+
+@lru_cache(maxsize=1024)
+def _is_doodle_breed(breed: str) -> bool:
+  """Whether a breed string earns the doodle/poodle bonus"""
+  breed = breed.lower()
+  return any(term in breed for term in ("doodle", "poodle", "poo"))
+
 
 class DAL:
   """
@@ -53,25 +263,77 @@ class DAL:
     self.db_path = db_path
     self.user_state_path = user_state_path
     self._user_states_cache: Optional[Dict] = None
+    # st_mtime_ns of user_state_path when the cache was filled (None = no file)
+    self._user_states_mtime: Optional[int] = None
+    self._acknowledged_cache: Optional[frozenset] = None
     self._user_preferences_cache: Optional[UserPreferences] = None
+    # One connection per thread, reused across calls (see _get_connection)
+    self._local = threading.local()
+    self._connections: List[sqlite3.Connection] = []
+    self._connections_lock = threading.Lock()
   
   # ============================================
   # Database Connection Management
   # ============================================
   
+  def _thread_connection(self) -> sqlite3.Connection:
+    """Open (once per thread) the connection reused by _get_connection"""
+    conn = getattr(self._local, "conn", None)
+    if conn is None:
+      # Autocommit mode: transactions are managed with SAVEPOINTs below.
+      # check_same_thread=False only so close() can run from any thread.
+      conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+      conn.row_factory = sqlite3.Row
+      # WAL is persistent; set it before any transaction is open
+      conn.execute("PRAGMA journal_mode=WAL")
+      for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+      self._local.conn = conn
+      self._local.depth = 0
+      with self._connections_lock:
+        self._connections.append(conn)
+    return conn
+  
   @contextmanager
   def _get_connection(self):
-    """Get database connection with automatic cleanup"""
-    conn = sqlite3.connect(self.db_path)
-    conn.row_factory = sqlite3.Row
+    """
+    Get this thread's database connection inside a SAVEPOINT.
+    Commits on success, rolls back on error; nested use only
+    commits when the outermost block exits.
+    """
+    conn = self._thread_connection()
+    savepoint = f"dal_{self._local.depth}"
+    conn.execute(f"SAVEPOINT {savepoint}")
+    self._local.depth += 1
     try:
       yield conn
-      conn.commit()
-    except Exception as e:
-      conn.rollback()
+    except BaseException:
+      # SQLite may already have rolled the whole transaction back
+      if conn.in_transaction:
+        conn.execute(f"ROLLBACK TO {savepoint}")
+        conn.execute(f"RELEASE {savepoint}")
       raise
+    else:
+      conn.execute(f"RELEASE {savepoint}")
     finally:
+      self._local.depth -= 1
+  
+  def close(self):
+    """Close every connection this DAL has opened, across all threads"""
+    with self._connections_lock:
+      connections, self._connections = self._connections, []
+    for conn in connections:
       conn.close()
+    self._local = threading.local()
+  
+  @contextmanager
+  def transaction(self):
+    """
+    Run several writes in a single transaction (one commit/fsync).
+    Yields a cursor that can be passed to save_dog / mark_dogs_inactive.
+    """
+    with self._get_connection() as conn:
+      yield conn.cursor()
   
   def init_database(self):
     """Initialize database schema"""
@@ -120,7 +382,8 @@ class DAL:
           is_active INTEGER DEFAULT 1,
           -- New schema fields (stored as JSON)
           rescue_meta_json TEXT,
-          images_json TEXT
+          images_json TEXT,  -- legacy, images now live in dog_images
+          rescue_meta_hash TEXT
         )
       """)
       
@@ -142,6 +405,21 @@ class DAL:
         )
       """)
       
+      # Dog images (replaces the images_json blob on dogs)
+      cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dog_images (
+          dog_id TEXT NOT NULL,
+          idx INTEGER NOT NULL,
+          url TEXT NOT NULL,
+          source TEXT,
+          priority INTEGER DEFAULT 0,
+          caption TEXT,
+          added_at TEXT,
+          PRIMARY KEY (dog_id, idx),
+          FOREIGN KEY (dog_id) REFERENCES dogs(dog_id)
+        ) WITHOUT ROWID
+      """)
+      
       # Legacy changes table (maintain for backward compatibility)
       cursor.execute("""
         CREATE TABLE IF NOT EXISTS changes (
@@ -159,25 +437,56 @@ class DAL:
       """)
       
       # Indexes
-      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_status ON dogs(status)")
-      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue ON dogs(rescue_name)")
-      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_fit ON dogs(fit_score)")
-      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_active ON dogs(is_active)")
-      cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_dog ON dog_events(dog_id)")
+      # List queries filter on is_active and sort by fit_score, so the
+      # composites below replace the old single-column indexes
+      for index in OBSOLETE_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {index}")
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_active_fit ON dogs(is_active, fit_score DESC)")
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue_active_fit ON dogs(rescue_name, is_active, fit_score DESC)")
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_status_active_fit ON dogs(status, is_active, fit_score DESC)")
+      # Partial index in the dashboard's exact order (fit_score DESC, dog_name), so the
+      # active-dog listing is an index walk with no temp B-tree sort
+      cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dogs_active_fit_name
+        ON dogs(fit_score DESC, dog_name)
+        WHERE is_active = 1
+      """)
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue_fit ON dogs(rescue_name, fit_score)")
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_dog_time ON dog_events(dog_id, timestamp DESC)")
       cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_type ON dog_events(event_type)")
       cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_time ON dog_events(timestamp)")
+      cursor.execute("CREATE INDEX IF NOT EXISTS idx_changes_timestamp ON changes(timestamp)")
       
-      # Migrations for existing databases
-      cursor.execute("PRAGMA table_info(dogs)")
-      columns = [col[1] for col in cursor.fetchall()]
-      
-      if "rescue_meta_json" not in columns:
-        cursor.execute("ALTER TABLE dogs ADD COLUMN rescue_meta_json TEXT")
-      if "images_json" not in columns:
-        cursor.execute("ALTER TABLE dogs ADD COLUMN images_json TEXT")
+      # Migrations for existing databases (skipped once user_version is current)
+      version = cursor.execute("PRAGMA user_version").fetchone()[0]
+      if version < 2:
+        cursor.execute("PRAGMA table_info(dogs)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        if "rescue_meta_json" not in columns:
+          cursor.execute("ALTER TABLE dogs ADD COLUMN rescue_meta_json TEXT")
+        if "images_json" not in columns:
+          cursor.execute("ALTER TABLE dogs ADD COLUMN images_json TEXT")
+        if "rescue_meta_hash" not in columns:
+          cursor.execute("ALTER TABLE dogs ADD COLUMN rescue_meta_hash TEXT")
+      if version < 3:
+        self._migrate_images_json(cursor)
+      if version < SCHEMA_VERSION:
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
       
       print("✅ Database initialized")
   
+  def _migrate_images_json(self, cursor: sqlite3.Cursor):
+    """Move images_json blobs into dog_images, then clear the legacy column"""
+    cursor.execute("SELECT dog_id, images_json FROM dogs WHERE images_json IS NOT NULL")
+    for row in cursor.fetchall():
+      try:
+        images = [DogImage.from_dict(img) for img in json.loads(row['images_json'])]
+      except (ValueError, TypeError):
+        continue
+      self._save_images(cursor, row['dog_id'], images)
+    cursor.execute("UPDATE dogs SET images_json = NULL WHERE images_json IS NOT NULL")
+  
   # ============================================
   # Dog CRUD Operations
   # ============================================
@@ -192,64 +501,137 @@ class DAL:
       if not row:
         return None
       
-      return self._row_to_dog(dict(row))
+      # Single-dog reads get the full rescue_meta and images; list
+      # endpoints stay on the minimal columns-only path
+      rescue_meta = None
+      if row['rescue_meta_json'] is not None:
+        try:
+          rescue_meta = RescueMeta.from_dict(json.loads(row['rescue_meta_json']))
+        except ValueError:
+          pass
+      cursor.execute(SELECT_IMAGES_SQL, (dog_id,))
+      images = [DogImage(*image) for image in cursor.fetchall()]
+      
+      return Dog.from_legacy(row, rescue_meta=rescue_meta, images=images)
   
-  def get_all_dogs(self, active_only: bool = True) -> List[Dog]:
-    """Get all dogs, optionally filtered by active status"""
+  def get_all_dogs(
+    self,
+    active_only: bool = True,
+    columns: Optional[Sequence[str]] = None
+  ) -> List[Dog]:
+    """
+    Get all dogs, optionally filtered by active status.
+    Pass `columns` to load only those fields; the rest keep Dog defaults.
+    """
+    select = _select_list(columns)
     with self._get_connection() as conn:
       cursor = conn.cursor()
       
       if active_only:
-        cursor.execute("SELECT * FROM dogs WHERE is_active = 1 ORDER BY fit_score DESC")
+        cursor.execute(f"SELECT {select} FROM dogs WHERE is_active = 1 ORDER BY fit_score DESC")
       else:
-        cursor.execute("SELECT * FROM dogs ORDER BY fit_score DESC")
+        cursor.execute(f"SELECT {select} FROM dogs ORDER BY fit_score DESC")
       
       rows = cursor.fetchall()
-      return [self._row_to_dog(dict(row)) for row in rows]
+      return [self._row_to_dog(row) for row in rows]
   
-  def get_dogs_by_rescue(self, rescue_name: str, active_only: bool = True) -> List[Dog]:
+  def get_dogs_by_rescue(
+    self,
+    rescue_name: str,
+    active_only: bool = True,
+    columns: Optional[Sequence[str]] = None
+  ) -> List[Dog]:
     """Get all dogs from a specific rescue"""
+    select = _select_list(columns)
     with self._get_connection() as conn:
       cursor = conn.cursor()
       
       if active_only:
         cursor.execute(
-          "SELECT * FROM dogs WHERE rescue_name = ? AND is_active = 1 ORDER BY fit_score DESC",
+          f"SELECT {select} FROM dogs WHERE rescue_name = ? AND is_active = 1 ORDER BY fit_score DESC",
           (rescue_name,)
         )
       else:
         cursor.execute(
-          "SELECT * FROM dogs WHERE rescue_name = ? ORDER BY fit_score DESC",
+          f"SELECT {select} FROM dogs WHERE rescue_name = ? ORDER BY fit_score DESC",
           (rescue_name,)
         )
       
       rows = cursor.fetchall()
-      return [self._row_to_dog(dict(row)) for row in rows]
+      return [self._row_to_dog(row) for row in rows]
   
-  def get_dogs_by_status(self, status: str) -> List[Dog]:
+  def get_dogs_by_status(self, status: str, columns: Optional[Sequence[str]] = None) -> List[Dog]:
     """Get all dogs with a specific status"""
+    select = _select_list(columns)
     with self._get_connection() as conn:
       cursor = conn.cursor()
       cursor.execute(
-        "SELECT * FROM dogs WHERE status = ? AND is_active = 1 ORDER BY fit_score DESC",
+        f"SELECT {select} FROM dogs WHERE status = ? AND is_active = 1 ORDER BY fit_score DESC",
         (status,)
       )
       rows = cursor.fetchall()
-      return [self._row_to_dog(dict(row)) for row in rows]
+      return [self._row_to_dog(row) for row in rows]
+  
+  def get_dogs_summary(self) -> List[Tuple]:
+    """
+    Lightweight listing of active dogs as plain tuples (see SUMMARY_COLUMNS).
+    Skips Row and Dog construction entirely.
+    """
+    with self._get_connection() as conn:
+      cursor = conn.cursor()
+      cursor.row_factory = None
+      cursor.execute(
+        f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM dogs WHERE is_active = 1 ORDER BY fit_score DESC"
+      )
+      return cursor.fetchall()
   
-  def save_dog(self, dog: Dog) -> List[DogEvent]:
+  def save_dog(self, dog: Dog, cursor: Optional[sqlite3.Cursor] = None) -> List[DogEvent]:
     """
     Save a dog (insert or update).
+    Pass a cursor from transaction() to batch several saves together.
     Returns list of events generated.
     """
-    existing = self.get_dog(dog.dog_id)
+    if cursor is None:
+      with self.transaction() as cursor:
+        return self.save_dog(dog, cursor)
     
-    if existing:
-      return self._update_dog(dog, existing)
+    change_rows = []
+    events = self._stage_dog(dog, cursor, change_rows)
+    self._save_events(cursor, events, change_rows)
+    return events
+  
+  def save_dogs_bulk(self, dogs: List[Dog]) -> List[DogEvent]:
+    """
+    Save many dogs in one transaction.
+    Event and change rows are buffered and written with executemany.
+    Returns all events generated, in input order.
+    """
+    events = []
+    change_rows = []
+    with self.transaction() as cursor:
+      for dog in dogs:
+        events.extend(self._stage_dog(dog, cursor, change_rows))
+      self._save_events(cursor, events, change_rows)
+    return events
+  
+  def _stage_dog(self, dog: Dog, cursor: sqlite3.Cursor, change_rows: List[tuple]) -> List[DogEvent]:
+    """
+    Upsert a dog and return its events without writing them.
+    Legacy changes rows are appended to `change_rows`.
+    """
+    # Only the columns the save compares against are read
+    cursor.execute(
+      f"SELECT {', '.join(PROBE_FIELDS)} FROM dogs WHERE dog_id = ?",
+      (dog.dog_id,)
+    )
+    row = cursor.fetchone()
+    
+    if row:
+      return self._update_dog(dog, dict(row), cursor, change_rows)
     else:
-      return self._insert_dog(dog)
+      return self._insert_dog(dog, cursor, change_rows)
   
-  def _insert_dog(self, dog: Dog) -> List[DogEvent]:
+  def _insert_dog(self, dog: Dog, cursor: sqlite3.Cursor, change_rows: List[tuple]) -> List[DogEvent]:
     """Insert a new dog"""
     events = []
     now = get_current_timestamp()
@@ -260,72 +642,41 @@ class DAL:
       dog_name=dog.dog_name,
       rescue_name=dog.rescue_name,
       status=dog.status,
-      fit_score=dog.base_fit_score or dog.fit_score
+      fit_score=dog.effective_base_score
     )
     events.append(event)
     
-    with self._get_connection() as conn:
-      cursor = conn.cursor()
-      
-      # Prepare JSON fields
-      rescue_meta_json = json.dumps(dog.rescue_meta.to_dict()) if dog.rescue_meta else None
-      images_json = json.dumps([img.to_dict() for img in dog.images]) if dog.images else None
-      
-      cursor.execute("""
-        INSERT INTO dogs (
-          dog_id, dog_name, rescue_name, breed, weight, age_range, age_category,
-          sex, shedding, energy_level, good_with_kids, good_with_dogs, good_with_cats,
-          special_needs, adoption_fee, platform, location, status, notes, source_url,
-          image_url, fit_score, watch_list, date_first_seen, date_last_updated,
-          date_status_changed, is_active, rescue_meta_json, images_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-      """, (
-        dog.dog_id, dog.dog_name, dog.rescue_name, dog.breed,
-        dog.weight_lbs or dog.weight,
-        dog.age_display or dog.age_range, "",
-        dog.sex, dog.shedding, dog.energy_level,
-        dog.good_with_kids, dog.good_with_dogs, dog.good_with_cats,
-        'Yes' if dog.special_needs else 'No',
-        dog.adoption_fee, dog.platform, dog.location, dog.status,
-        dog.rescue_meta.bio_text if dog.rescue_meta else "",
-        dog.rescue_dog_url or dog.source_url,
-        dog.primary_image_url or dog.image_url,
-        dog.base_fit_score or dog.fit_score,
-        dog.watch_list, now, now, now, 1,
-        rescue_meta_json, images_json
-      ))
-      
-      # Save event
-      self._save_event(cursor, event)
-      
-      # Also save to legacy changes table
-      cursor.execute("""
-        INSERT INTO changes (dog_id, dog_name, field_changed, old_value, new_value, change_type, timestamp)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-      """, (
-        dog.dog_id, dog.dog_name, "dog", "",
-        f"New: {dog.status} | Fit: {dog.fit_score} | {dog.breed}",
-        "new_dog", now
-      ))
+    self._upsert_dog(cursor, dog, now)
+    
+    # Also record in legacy changes table
+    change_rows.append((
+      dog.dog_id, dog.dog_name, "dog", "",
+      f"New: {dog.status} | Fit: {dog.fit_score} | {dog.breed}",
+      "new_dog", now
+    ))
     
     print(f"  🆕 New dog: {dog.dog_name} ({dog.rescue_name}) - Fit: {dog.fit_score}")
     return events
   
-  def _update_dog(self, dog: Dog, existing: Dog) -> List[DogEvent]:
-    """Update an existing dog, detecting and recording changes"""
+  def _update_dog(
+    self,
+    dog: Dog,
+    existing: Dict,
+    cursor: sqlite3.Cursor,
+    change_rows: List[tuple]
+  ) -> List[DogEvent]:
+    """
+    Update an existing dog, detecting and recording changes.
+    `existing` holds the stored PROBE_FIELDS columns.
+    """
     events = []
     now = get_current_timestamp()
     
-    # Detect changes
-    tracked_fields = [
-      'status', 'weight', 'shedding', 'energy_level',
-      'good_with_kids', 'good_with_dogs', 'good_with_cats',
-      'special_needs', 'adoption_fee', 'fit_score'
-    ]
-    
-    old_data = existing.to_legacy_dict()
+    # Detect changes (special_needs is normalized the way to_legacy_dict does)
+    old_data = dict(existing)
+    old_data['special_needs'] = 'Yes' if existing['special_needs'] == 'Yes' else 'No'
     new_data = dog.to_legacy_dict()
-    changes = detect_changes(old_data, new_data, tracked_fields)
+    changes = detect_changes(old_data, new_data, TRACKED_FIELDS)
     
     # Handle status change separately
     if 'status' in changes:
@@ -351,54 +702,76 @@ class DAL:
       events.append(event)
     
     # Update database
-    with self._get_connection() as conn:
-      cursor = conn.cursor()
-      
-      rescue_meta_json = json.dumps(dog.rescue_meta.to_dict()) if dog.rescue_meta else None
-      images_json = json.dumps([img.to_dict() for img in dog.images]) if dog.images else None
-      
-      cursor.execute("""
-        UPDATE dogs SET
-          dog_name = ?, rescue_name = ?, breed = ?, weight = ?,
-          age_range = ?, sex = ?, shedding = ?, energy_level = ?,
-          good_with_kids = ?, good_with_dogs = ?, good_with_cats = ?,
-          special_needs = ?, adoption_fee = ?, platform = ?, location = ?,
-          status = ?, notes = ?, source_url = ?, image_url = ?, fit_score = ?,
-          date_last_updated = ?, is_active = 1,
-          rescue_meta_json = ?, images_json = ?
-        WHERE dog_id = ?
-      """, (
-        dog.dog_name, dog.rescue_name, dog.breed,
-        dog.weight_lbs or dog.weight,
-        dog.age_display or dog.age_range,
-        dog.sex, dog.shedding, dog.energy_level,
-        dog.good_with_kids, dog.good_with_dogs, dog.good_with_cats,
-        'Yes' if dog.special_needs else 'No',
-        dog.adoption_fee, dog.platform, dog.location, dog.status,
-        dog.rescue_meta.bio_text if dog.rescue_meta else "",
-        dog.rescue_dog_url or dog.source_url,
-        dog.primary_image_url or dog.image_url,
-        dog.base_fit_score or dog.fit_score,
-        now, rescue_meta_json, images_json, dog.dog_id
-      ))
-      
-      # Save events
-      for event in events:
-        self._save_event(cursor, event)
-        
-        # Also save to legacy changes table
-        cursor.execute("""
-          INSERT INTO changes (dog_id, dog_name, field_changed, old_value, new_value, change_type, timestamp)
-          VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-          event.dog_id, dog.dog_name, event.field_changed or event.event_type,
-          event.old_value or "", event.new_value or event.summary,
-          event.event_type, event.timestamp
-        ))
+    self._upsert_dog(cursor, dog, now, existing)
+    
+    # Also record in legacy changes table
+    change_rows.extend(
+      (
+        event.dog_id, dog.dog_name, event.field_changed or event.event_type,
+        event.old_value or "", event.new_value or event.summary,
+        event.event_type, event.timestamp
+      )
+      for event in events
+    )
     
     return events
   
-  def mark_dogs_inactive(self, active_dog_ids: List[str], rescue_name: str) -> List[DogEvent]:
+  def _upsert_dog(
+    self,
+    cursor: sqlite3.Cursor,
+    dog: Dog,
+    now: str,
+    existing: Optional[Dict] = None
+  ):
+    """
+    Write a dog row via UPSERT_DOG_SQL.
+    `existing` (the stored PROBE_FIELDS) enables two shortcuts: rescue_meta/images
+    are only rewritten when their hash changed, and a dog whose scraped
+    columns all match is just touched via TOUCH_DOG_SQL.
+    """
+    content = _content_values(dog)
+    payload_hash = _payload_hash(dog)
+    stored_hash = existing['rescue_meta_hash'] if existing else None
+    
+    if (
+      existing is not None
+      and payload_hash == stored_hash
+      and existing['is_active'] == 1
+      and all(existing[name] == value for name, value in zip(CONTENT_FIELDS, content))
+    ):
+      cursor.execute(TOUCH_DOG_SQL, (now, dog.dog_id))
+      return
+    
+    if payload_hash == stored_hash:
+      # The UPSERT keeps the stored JSON (and images) when the hash matches
+      rescue_meta_json = None
+    else:
+      rescue_meta_json = json.dumps(dog.rescue_meta.to_dict()) if dog.rescue_meta else None
+    
+    cursor.execute(UPSERT_DOG_SQL, (
+      dog.dog_id, *content,
+      "", dog.watch_list, now, now, now, 1,
+      rescue_meta_json, payload_hash
+    ))
+    
+    if payload_hash != stored_hash and (existing is not None or dog.images):
+      self._save_images(cursor, dog.dog_id, dog.images)
+  
+  def _save_images(self, cursor: sqlite3.Cursor, dog_id: str, images: List[DogImage]):
+    """Replace a dog's dog_images rows"""
+    cursor.execute(DELETE_IMAGES_SQL, (dog_id,))
+    if images:
+      cursor.executemany(INSERT_IMAGE_SQL, [
+        (dog_id, idx, img.url, img.source, img.priority, img.caption, img.added_at)
+        for idx, img in enumerate(images)
+      ])
+  
+  def mark_dogs_inactive(
+    self,
+    active_dog_ids: List[str],
+    rescue_name: str,
+    cursor: Optional[sqlite3.Cursor] = None
+  ) -> List[DogEvent]:
     """Mark dogs not in the current scrape as inactive (likely adopted)"""
     events = []
     now = get_current_timestamp()
@@ -406,80 +779,82 @@ class DAL:
     if not active_dog_ids:
       return events
     
-    with self._get_connection() as conn:
-      cursor = conn.cursor()
-      
-      # Find dogs from this rescue that are active but not in current scrape
-      placeholders = ",".join("?" * len(active_dog_ids))
-      cursor.execute(f"""
-        SELECT dog_id, dog_name, status FROM dogs 
-        WHERE rescue_name = ? AND is_active = 1 AND dog_id NOT IN ({placeholders})
-      """, [rescue_name] + active_dog_ids)
+    if cursor is None:
+      with self.transaction() as cursor:
+        return self.mark_dogs_inactive(active_dog_ids, rescue_name, cursor)
+    
+    # Find dogs from this rescue that are active but not in current scrape.
+    # The scraped IDs go through a temp table rather than a NOT IN (?, ...)
+    # list, which would hit SQLite's bound-parameter limit on large rescues.
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS _active_ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+    cursor.execute("DELETE FROM _active_ids")
+    cursor.executemany(
+      "INSERT OR IGNORE INTO _active_ids VALUES (?)",
+      [(dog_id,) for dog_id in active_dog_ids]
+    )
+    cursor.execute("""
+      SELECT dog_id, dog_name, status FROM dogs d
+      WHERE rescue_name = ? AND is_active = 1
+        AND NOT EXISTS (SELECT 1 FROM _active_ids a WHERE a.id = d.dog_id)
+    """, (rescue_name,))
+    
+    missing_dogs = cursor.fetchall()
+    cursor.execute("DROP TABLE _active_ids")
+    
+    for row in missing_dogs:
+      dog_id = row['dog_id']
+      dog_name = row['dog_name']
+      old_status = row['status']
       
-      missing_dogs = cursor.fetchall()
+      # Create status change event
+      event = create_status_change_event(
+        dog_id=dog_id,
+        dog_name=dog_name,
+        rescue_name=rescue_name,
+        old_status=old_status,
+        new_status="Adopted/Removed"
+      )
+      events.append(event)
       
-      for row in missing_dogs:
-        dog_id = row['dog_id']
-        dog_name = row['dog_name']
-        old_status = row['status']
-        
-        # Create status change event
-        event = create_status_change_event(
-          dog_id=dog_id,
-          dog_name=dog_name,
-          rescue_name=rescue_name,
-          old_status=old_status,
-          new_status="Adopted/Removed"
-        )
-        events.append(event)
-        
-        # Update dog
-        cursor.execute("""
-          UPDATE dogs SET is_active = 0, status = 'Adopted/Removed', 
-          date_went_unavailable = ?, date_last_updated = ?
-          WHERE dog_id = ?
-        """, (now, now, dog_id))
-        
-        # Save event
-        self._save_event(cursor, event)
-        
-        print(f"  🏠 Likely adopted: {dog_name}")
+      print(f"  🏠 Likely adopted: {dog_name}")
     
+    # Update dogs and save events in one batch each
+    cursor.executemany("""
+      UPDATE dogs SET is_active = 0, status = 'Adopted/Removed', 
+      date_went_unavailable = ?, date_last_updated = ?
+      WHERE dog_id = ?
+    """, [(now, now, row['dog_id']) for row in missing_dogs])
+    self._save_events(cursor, events)
     return events
   
-  def _row_to_dog(self, row: Dict) -> Dog:
+  def _row_to_dog(self, row: sqlite3.Row) -> Dog:
     """Convert database row to Dog object"""
-    # Parse JSON fields
-    rescue_meta = None
-    if row.get('rescue_meta_json'):
-      try:
-        rescue_meta = RescueMeta.from_dict(json.loads(row['rescue_meta_json']))
-      except:
-        pass
-    
-    images = []
-    if row.get('images_json'):
-      try:
-        images = [DogImage.from_dict(img) for img in json.loads(row['images_json'])]
-      except:
-        pass
-    
     return Dog.from_legacy(row)
   
   def _save_event(self, cursor, event: DogEvent):
     """Save an event to the database"""
-    details_json = json.dumps(event.details) if event.details else None
-    
-    cursor.execute("""
-      INSERT OR REPLACE INTO dog_events (
-        event_id, dog_id, event_type, timestamp, source, summary,
-        field_changed, old_value, new_value, details_json, created_by
-      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-      event.event_id, event.dog_id, event.event_type, event.timestamp,
-      event.source, event.summary, event.field_changed,
-      event.old_value, event.new_value, details_json, event.created_by
-    ))
+    self._save_events(cursor, [event])
+  
+  def _save_events(
+    self,
+    cursor: sqlite3.Cursor,
+    events: List[DogEvent],
+    change_rows: Optional[List[tuple]] = None
+  ):
+    """Write events (and optional legacy changes rows) with executemany"""
+    if events:
+      cursor.executemany(INSERT_EVENT_SQL, [
+        (
+          event.event_id, event.dog_id, event.event_type, event.timestamp,
+          event.source, event.summary, event.field_changed,
+          event.old_value, event.new_value,
+          json.dumps(event.details) if event.details else None,
+          event.created_by
+        )
+        for event in events
+      ])
+    if change_rows:
+      cursor.executemany(INSERT_CHANGE_SQL, change_rows)
   
   # ============================================
   # Event Operations
@@ -539,15 +914,29 @@ class DAL:
   # User State Operations
   # ============================================
   
+  def _user_states_file_mtime(self) -> Optional[int]:
+    """Modification time of the user state file, or None if it doesn't exist"""
+    try:
+      return os.stat(self.user_state_path).st_mtime_ns
+    except OSError:
+      return None
+  
   def _load_user_states(self) -> Dict:
-    """Load user states from JSON file"""
-    if self._user_states_cache is not None:
+    """
+    Load user states from JSON file.
+    Cached until the file's mtime changes, so edits by other processes are seen.
+    """
+    mtime = self._user_states_file_mtime()
+    if self._user_states_cache is not None and mtime == self._user_states_mtime:
       return self._user_states_cache
     
-    if os.path.exists(self.user_state_path):
+    self._acknowledged_cache = None
+    self._user_states_mtime = mtime
+    
+    if mtime is not None:
       try:
-        with open(self.user_state_path, 'r') as f:
-          data = json.load(f)
+        with open(self.user_state_path, 'rb') as f:
+          data = _json_loads(f.read())
           self._user_states_cache = data
           return data
       except Exception as e:
@@ -557,13 +946,24 @@ class DAL:
     return self._user_states_cache
   
   def _save_user_states(self, data: Dict):
-    """Save user states to JSON file"""
+    """Save user states to JSON file (written to a temp file, then renamed into place)"""
     self._user_states_cache = data
+    self._acknowledged_cache = None
+    tmp_path = self.user_state_path + ".tmp"
     try:
-      with open(self.user_state_path, 'w') as f:
-        json.dump(data, f, indent=2)
+      with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps_pretty(data))
+      os.replace(tmp_path, self.user_state_path)
     except Exception as e:
       print(f"⚠️ Error saving user states: {e}")
+    self._user_states_mtime = self._user_states_file_mtime()
+  
+  def is_change_acknowledged(self, change_key: str) -> bool:
+    """Whether the user has acknowledged a change (set lookup, cached with the file)"""
+    data = self._load_user_states()
+    if self._acknowledged_cache is None:
+      self._acknowledged_cache = frozenset(data.get("acknowledgedChanges", []))
+    return change_key in self._acknowledged_cache
   
   def get_user_dog_state(self, user_id: str, dog_id: str) -> UserDogState:
     """Get user's state for a specific dog"""
@@ -630,10 +1030,42 @@ class DAL:
     if config is None:
       config = ScoringConfig()
     
+    return self._score_dog(dog, overrides, config, _shedding_points(config))
+  
+  def compute_fit_scores_bulk(
+    self,
+    dogs: List[Dog],
+    overrides_map: Optional[Dict[str, UserOverrides]] = None,
+    config: Optional[ScoringConfig] = None
+  ) -> List[int]:
+    """
+    Compute fit scores for many dogs under one scoring config.
+    `overrides_map` maps dog_id -> UserOverrides. Returns scores in input order.
+    """
+    if config is None:
+      config = ScoringConfig()
+    if overrides_map is None:
+      overrides_map = {}
+    
+    shedding_points = _shedding_points(config)
+    score_dog = self._score_dog
+    return [
+      score_dog(dog, overrides_map.get(dog.dog_id), config, shedding_points)
+      for dog in dogs
+    ]
+  
+  def _score_dog(
+    self,
+    dog: Dog,
+    overrides: Optional[UserOverrides],
+    config: ScoringConfig,
+    shedding_points: Dict[str, int]
+  ) -> int:
+    """Score one dog; shedding_points comes from _shedding_points(config)"""
     score = 0
     
     # Get effective values (override if provided)
-    weight = overrides.weight_lbs if (overrides and overrides.weight_lbs) else (dog.weight_lbs or dog.weight)
+    weight = overrides.weight_lbs if (overrides and overrides.weight_lbs) else dog.effective_weight
     shedding = overrides.shedding if (overrides and overrides.shedding) else dog.shedding
     energy = overrides.energy_level if (overrides and overrides.energy_level) else dog.energy_level
     good_dogs = overrides.good_with_dogs if (overrides and overrides.good_with_dogs) else dog.good_with_dogs
@@ -649,7 +1081,7 @@ class DAL:
     age_years = overrides.age_years if (overrides and overrides.age_years) else dog.age_years
     if age_years is None:
       # Try to parse from age_display/age_range
-      age_years = self._parse_age_to_years(dog.age_display or dog.age_range)
+      age_years = _parse_age_to_years(dog.effective_age)
     
     if age_years is not None:
       if age_years < 0.75:
@@ -667,22 +1099,13 @@ class DAL:
     
     # Shedding scoring
     if shedding:
-      shedding_lower = shedding.lower()
-      if shedding_lower == "none":
-        score += config.shedding_none
-      elif shedding_lower == "low":
-        score += config.shedding_low
-      elif shedding_lower == "high":
-        score += config.shedding_high
-      elif shedding_lower == "unknown":
-        score += config.shedding_unknown
+      score += shedding_points.get(shedding.lower(), 0)
     else:
       score += config.shedding_unknown
     
     # Energy scoring
     if energy:
-      energy_lower = energy.lower()
-      if energy_lower in ["low", "medium"]:
+      if energy.lower() in _LOW_MED_ENERGY:
         score += config.energy_low_med
     else:
       score += config.energy_unknown
@@ -696,8 +1119,7 @@ class DAL:
       score += config.good_with_cats
     
     # Breed bonus
-    breed = dog.breed or ""
-    if any(term in breed.lower() for term in ["doodle", "poodle", "poo"]):
+    if _is_doodle_breed(dog.breed or ""):
       score += config.doodle_breed
     
     # Special needs penalty
@@ -714,37 +1136,8 @@ class DAL:
     
     return max(0, score)
   
-  def _parse_age_to_years(self, age_str: Optional[str]) -> Optional[float]:
-    """Parse age string to years"""
-    if not age_str:
-      return None
-    
-    import re
-    age_str = age_str.lower().replace("–", "-").replace("—", "-")
-    
-    # Range: "1-3 yrs"
-    match = re.search(r"(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\s*(yr|year|mo|month)", age_str)
-    if match:
-      min_val = float(match.group(1))
-      max_val = float(match.group(2))
-      unit = match.group(3)
-      if unit.startswith("mo"):
-        min_val /= 12
-        max_val /= 12
-      return (min_val + max_val) / 2
-    
-    # Single: "2 yrs" or "8 mos"
-    match = re.search(r"(\d+\.?\d*)\s*(yr|year|mo|month|wk|week)", age_str)
-    if match:
-      val = float(match.group(1))
-      unit = match.group(2)
-      if unit.startswith("mo"):
-        val /= 12
-      elif unit.startswith("wk") or unit.startswith("week"):
-        val /= 52
-      return val
-    
-    return None
+  # Kept as a method for callers that go through a DAL instance
+  _parse_age_to_years = staticmethod(_parse_age_to_years)
   
   # ============================================
   # Convenience Methods
@@ -758,7 +1151,8 @@ class DAL:
     with self._get_connection() as conn:
       cursor = conn.cursor()
       cursor.execute("""
-        SELECT c.*, d.fit_score as current_fit
+        SELECT c.id, c.dog_id, c.dog_name, c.field_changed, c.old_value,
+               c.new_value, c.change_type, c.timestamp, d.fit_score as current_fit
         FROM changes c
         LEFT JOIN dogs d ON c.dog_id = d.dog_id
         WHERE c.timestamp > datetime('now', '-7 days')
@@ -777,14 +1171,35 @@ class DAL:
     """Apply user overrides to a list of dogs and recompute scores"""
     prefs = self.get_user_preferences(user_id)
     
-    for dog in dogs:
-      state = self.get_user_dog_state(user_id, dog.dog_id)
-      dog.fit_score = self.compute_fit_score(dog, state.overrides, prefs.scoring_config)
-      dog.watch_list = "Yes" if state.favorite else ""
+    # Read the override map once; acknowledged changes aren't needed for scoring
+    dogs_data = self._load_user_states().get("dogs", {})
+    states = {
+      dog.dog_id: UserDogState.from_legacy_override(dog.dog_id, dogs_data.get(dog.dog_id, {}))
+      for dog in dogs
+    }
+    
+    scores = self.compute_fit_scores_bulk(
+      dogs,
+      {dog_id: state.overrides for dog_id, state in states.items()},
+      prefs.scoring_config
+    )
+    for dog, score in zip(dogs, scores):
+      dog.fit_score = score
+      dog.watch_list = "Yes" if states[dog.dog_id].favorite else ""
     
     return dogs
 
 
+def _select_list(columns: Optional[Sequence[str]]) -> str:
+  """SELECT list for the dogs table; None means every column"""
+  if not columns:
+    return "*"
+  unknown = set(columns) - DOG_COLUMNS
+  if unknown:
+    raise ValueError(f"Unknown dog columns: {sorted(unknown)}")
+  return ", ".join(columns)
+
+
 # Create a default instance for easy importing
 _default_dal: Optional[DAL] = None
 
@@ -793,4 +1208,5 @@ def get_dal() -> DAL:
   global _default_dal
   if _default_dal is None:
     _default_dal = DAL()
+    atexit.register(_default_dal.close)
   return _default_dal
@@ -2,6 +2,7 @@
 SQLite database operations for dog rescue tracker
 v1.0.0 - Initial schema
 """
+import atexit
 import sqlite3
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -10,6 +11,21 @@ from models import Dog, ChangeRecord, get_current_timestamp
 
 DB_FILE = "dogs.db"
 
+# Pragmas applied once to the shared read connection
+READ_PRAGMAS = (
+  "PRAGMA journal_mode=WAL",
+  "PRAGMA synchronous=NORMAL",
+  "PRAGMA temp_store=MEMORY",
+  "PRAGMA cache_size=-65536",
+  "PRAGMA mmap_size=268435456",
+  "PRAGMA busy_timeout=5000",
+)
+
+_read_conn: Optional[sqlite3.Connection] = None
+
+# DB_FILE whose schema init_database() has already bootstrapped in this process
+_initialized_db: Optional[str] = None
+
 
 def get_connection() -> sqlite3.Connection:
   """Get database connection with row factory"""
@@ -18,8 +34,36 @@ def get_connection() -> sqlite3.Connection:
   return conn
 
 
+def get_read_connection() -> sqlite3.Connection:
+  """
+  Get the shared, long-lived connection used for read-only analytics.
+  Opened and tuned once per process; callers must NOT close it.
+  """
+  global _read_conn
+  if _read_conn is None:
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in READ_PRAGMAS:
+      conn.execute(pragma)
+    _read_conn = conn
+  return _read_conn
+
+
+@atexit.register
+def close_read_connection():
+  """Close the shared read connection (checkpoints the WAL back into dogs.db)"""
+  global _read_conn
+  if _read_conn is not None:
+    _read_conn.close()
+    _read_conn = None
+
+
 def init_database():
-  """Initialize database schema"""
+  """Initialize database schema (once per process for a given DB_FILE)"""
+  global _initialized_db
+  if _initialized_db == DB_FILE:
+    return
+  
   conn = get_connection()
   cursor = conn.cursor()
   
@@ -105,12 +149,30 @@ def init_database():
   """)
   
   # Create indexes for common queries
-  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_status ON dogs(status)")
-  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue ON dogs(rescue_name)")
-  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_fit ON dogs(fit_score)")
+  # (same composite dogs indexes as dal.DAL.init_database)
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_active_fit ON dogs(is_active, fit_score DESC)")
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue_active_fit ON dogs(rescue_name, is_active, fit_score DESC)")
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_status_active_fit ON dogs(status, is_active, fit_score DESC)")
+  # Partial index in the dashboard's exact order (fit_score DESC, dog_name), so the
+  # active-dog listing is an index walk with no temp B-tree sort
+  cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_dogs_active_fit_name
+    ON dogs(fit_score DESC, dog_name)
+    WHERE is_active = 1
+  """)
   cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_watch ON dogs(watch_list)")
   cursor.execute("CREATE INDEX IF NOT EXISTS idx_changes_dog ON changes(dog_id)")
   cursor.execute("CREATE INDEX IF NOT EXISTS idx_changes_type ON changes(change_type)")
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_changes_timestamp ON changes(timestamp)")
+  
+  # Indexes for analytics (see analysis.py)
+  cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_history_status_days
+    ON status_history(status, days_in_previous_status)
+    WHERE days_in_previous_status IS NOT NULL
+  """)
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_dog_time ON status_history(dog_id, timestamp)")
+  cursor.execute("CREATE INDEX IF NOT EXISTS idx_dogs_rescue_fit ON dogs(rescue_name, fit_score)")
   
   # Migrations for existing databases
   # Add image_url column if it doesn't exist
@@ -134,8 +196,12 @@ def init_database():
     cursor.execute("ALTER TABLE dogs ADD COLUMN age_score INTEGER")
     print("  📅 Added age_score column to dogs table")
   
+  # Refresh planner statistics so the new indexes get used
+  cursor.execute("ANALYZE")
+  
   conn.commit()
   conn.close()
+  _initialized_db = DB_FILE
   print("✅ Database initialized")
 
 
@@ -6,6 +6,7 @@ v1.0.0 - Phase 3 Dashboard Integration
 
 Generates complete static site:
 - dashboard.html (main page)
+- assets/dashboard.css (dashboard stylesheet)
 - dogs/*.html (detail pages for each dog)
 
 Usage:
@@ -106,6 +107,7 @@ def generate_site(output_dir: str = "site", dashboard_only: bool = False) -> dic
   print(f"   {output_dir}/")
   print(f"   ├── index.html (redirect)")
   print(f"   ├── dashboard.html")
+  print(f"   ├── assets/dashboard.css")
   print(f"   └── dogs/")
   print(f"       └── *.html ({stats['dog_pages']} files)")
   
@@ -18,6 +18,16 @@ from enum import Enum
 import json
 
 
+def _row_getter(row):
+  """dict.get-style lookup for a sqlite3.Row; columns not selected give the default"""
+  def get(key: str, default: Any = None) -> Any:
+    try:
+      return row[key]
+    except IndexError:
+      return default
+  return get
+
+
 class DogStatus(str, Enum):
   """Standardized dog status values"""
   AVAILABLE = "Available"
@@ -219,6 +229,34 @@ class Dog:
     elif self.fit_score and not self.base_fit_score:
       self.base_fit_score = self.fit_score
   
+  # ===== EFFECTIVE VALUES (new field, falling back to its legacy alias) =====
+  # Plain properties rather than cached attributes: scrapers and overrides
+  # assign these fields after construction.
+  
+  @property
+  def effective_weight(self) -> Optional[int]:
+    return self.weight_lbs or self.weight
+  
+  @property
+  def effective_age(self) -> Optional[str]:
+    return self.age_display or self.age_range
+  
+  @property
+  def effective_source_url(self) -> Optional[str]:
+    return self.rescue_dog_url or self.source_url
+  
+  @property
+  def effective_image_url(self) -> Optional[str]:
+    return self.primary_image_url or self.image_url
+  
+  @property
+  def effective_base_score(self) -> Optional[int]:
+    return self.base_fit_score or self.fit_score
+  
+  @property
+  def special_needs_label(self) -> str:
+    return 'Yes' if self.special_needs else 'No'
+  
   def to_dict(self) -> Dict:
     """Convert to dictionary for storage"""
     result = {}
@@ -257,51 +295,65 @@ class Dog:
     return cls(**valid_fields)
   
   @classmethod
-  def from_legacy(cls, legacy_data: Dict) -> "Dog":
+  def from_legacy(
+    cls,
+    legacy_data: Dict,
+    rescue_meta: Optional[RescueMeta] = None,
+    images: Optional[List[DogImage]] = None
+  ) -> "Dog":
     """
     Create Dog from legacy database format.
     Maps old field names to new schema.
+    Accepts a dict or a sqlite3.Row (read in place, without copying).
+    Pass already-loaded rescue_meta/images to use them instead of the
+    minimal RescueMeta built from the notes/adoption_req columns.
     """
+    get = legacy_data.get if isinstance(legacy_data, dict) else _row_getter(legacy_data)
+    
     # Direct mappings
     dog = cls(
-      dog_id=legacy_data.get('dog_id', ''),
-      dog_name=legacy_data.get('dog_name', ''),
-      rescue_name=legacy_data.get('rescue_name', ''),
-      rescue_dog_url=legacy_data.get('source_url'),
-      platform=legacy_data.get('platform', ''),
-      status=legacy_data.get('status', 'Unknown'),
-      is_active=bool(legacy_data.get('is_active', 1)),
-      weight_lbs=legacy_data.get('weight'),
-      age_display=legacy_data.get('age_range'),
-      sex=legacy_data.get('sex'),
-      breed=legacy_data.get('breed'),
-      location=legacy_data.get('location'),
-      good_with_dogs=legacy_data.get('good_with_dogs'),
-      good_with_cats=legacy_data.get('good_with_cats'),
-      good_with_kids=legacy_data.get('good_with_kids'),
-      shedding=legacy_data.get('shedding'),
-      energy_level=legacy_data.get('energy_level'),
-      special_needs=legacy_data.get('special_needs') == 'Yes',
-      adoption_fee=legacy_data.get('adoption_fee'),
-      primary_image_url=legacy_data.get('image_url'),
-      base_fit_score=legacy_data.get('fit_score'),
-      created_at=legacy_data.get('date_first_seen'),
-      updated_at=legacy_data.get('date_last_updated'),
-      status_changed_at=legacy_data.get('date_status_changed'),
+      dog_id=get('dog_id', ''),
+      dog_name=get('dog_name', ''),
+      rescue_name=get('rescue_name', ''),
+      rescue_dog_url=get('source_url'),
+      platform=get('platform', ''),
+      status=get('status', 'Unknown'),
+      is_active=bool(get('is_active', 1)),
+      weight_lbs=get('weight'),
+      age_display=get('age_range'),
+      sex=get('sex'),
+      breed=get('breed'),
+      location=get('location'),
+      good_with_dogs=get('good_with_dogs'),
+      good_with_cats=get('good_with_cats'),
+      good_with_kids=get('good_with_kids'),
+      shedding=get('shedding'),
+      energy_level=get('energy_level'),
+      special_needs=get('special_needs') == 'Yes',
+      adoption_fee=get('adoption_fee'),
+      primary_image_url=get('image_url'),
+      base_fit_score=get('fit_score'),
+      created_at=get('date_first_seen'),
+      updated_at=get('date_last_updated'),
+      status_changed_at=get('date_status_changed'),
       # Legacy fields
-      source_url=legacy_data.get('source_url'),
-      image_url=legacy_data.get('image_url'),
-      age_range=legacy_data.get('age_range'),
-      weight=legacy_data.get('weight'),
-      fit_score=legacy_data.get('fit_score'),
-      watch_list=legacy_data.get('watch_list', ''),
+      source_url=get('source_url'),
+      image_url=get('image_url'),
+      age_range=get('age_range'),
+      weight=get('weight'),
+      fit_score=get('fit_score'),
+      watch_list=get('watch_list', ''),
     )
     
     # Build rescue_meta from legacy fields
-    dog.rescue_meta = RescueMeta(
-      bio_text=legacy_data.get('notes'),
-      adoption_requirements_text=legacy_data.get('adoption_req'),
-    )
+    if rescue_meta is None:
+      rescue_meta = RescueMeta(
+        bio_text=get('notes'),
+        adoption_requirements_text=get('adoption_req'),
+      )
+    dog.rescue_meta = rescue_meta
+    if images is not None:
+      dog.images = images
     
     return dog
   
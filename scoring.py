@@ -7,6 +7,10 @@ from models import Dog
 from config import SCORING_WEIGHTS, WATCH_LIST_DOGS
 from typing import Tuple, Optional
 
+# Frozen categorical point tables; unmatched values score as "Unknown"
+SHEDDING_SCORES = SCORING_WEIGHTS["shedding"]
+ENERGY_SCORES = SCORING_WEIGHTS["energy"]
+
 
 def parse_age_to_years(age_str: str) -> Tuple[Optional[float], Optional[float], bool]:
   """
@@ -147,17 +151,11 @@ def calculate_fit_score(dog: Dog) -> int:
   
   # Shedding score
   shedding_value = dog.shedding.strip() if dog.shedding else "Unknown"
-  if shedding_value in SCORING_WEIGHTS["shedding"]:
-    score += SCORING_WEIGHTS["shedding"][shedding_value]
-  else:
-    score += SCORING_WEIGHTS["shedding"].get("Unknown", 0)
+  score += SHEDDING_SCORES.get(shedding_value, SHEDDING_SCORES.get("Unknown", 0))
   
   # Energy level score
   energy_value = dog.energy_level.strip() if dog.energy_level else "Unknown"
-  if energy_value in SCORING_WEIGHTS["energy"]:
-    score += SCORING_WEIGHTS["energy"][energy_value]
-  else:
-    score += SCORING_WEIGHTS["energy"].get("Unknown", 0)
+  score += ENERGY_SCORES.get(energy_value, ENERGY_SCORES.get("Unknown", 0))
   
   # Good with kids
   if dog.good_with_kids and dog.good_with_kids.strip().lower() == "yes":
@@ -23,6 +23,7 @@ import os
 import time
 import json
 import argparse
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Dict
 
@@ -33,6 +34,7 @@ from config import RESCUES
 from dal import DAL, get_dal
 from scrapers import PoodlePatchScraper, DoodleRockScraper, DoodleDandyScraper
 from notifications import send_notification, is_configured as email_configured
+from analysis import invalidate_analytics_snapshot
 from schema import Dog, get_current_timestamp
 
 # Legacy imports for backward compatibility
@@ -98,25 +100,18 @@ def run_scrape(test_mode: bool = False) -> Dict:
       legacy_dogs = scraper.scrape()
       
       # Track IDs for this rescue
-      scraped_ids = []
-      new_count = 0
+      scraped_ids = [legacy_dog.dog_id for legacy_dog in legacy_dogs]
       
-      # Update database via DAL
-      for legacy_dog in legacy_dogs:
-        scraped_ids.append(legacy_dog.dog_id)
-        
-        # Convert legacy Dog to new schema Dog
-        # (For now, scrapers still use legacy Dog, we convert here)
-        dog = _legacy_to_new_dog(legacy_dog)
-        
-        # Save via DAL - returns events
-        events = dal.save_dog(dog)
-        all_events.extend(events)
-        
-        # Count new dogs
-        for event in events:
-          if event.event_type == "first_seen":
-            new_count += 1
+      # Convert legacy Dog to new schema Dog
+      # (For now, scrapers still use legacy Dog, we convert here)
+      dogs = [_legacy_to_new_dog(legacy_dog) for legacy_dog in legacy_dogs]
+      
+      # Save via DAL in one transaction - returns events
+      events = dal.save_dogs_bulk(dogs)
+      all_events.extend(events)
+      
+      # Count new dogs
+      new_count = sum(1 for event in events if event.event_type == "first_seen")
       
       # Mark missing dogs as inactive
       if scraped_ids:
@@ -170,6 +165,9 @@ def run_scrape(test_mode: bool = False) -> Dict:
   print("\n📋 Applying user overrides...")
   _apply_user_overrides_via_dal(dal)
   
+  # New data invalidates any cached analytics report
+  invalidate_analytics_snapshot()
+  
   # Send notifications (unless test mode)
   if all_events and not test_mode:
     print("\n📧 Sending notifications...")
@@ -268,6 +266,10 @@ def _apply_user_overrides_via_dal(dal: DAL):
     print(f"  ✅ Applied overrides to {applied_count} dogs")
 
 
+# Only the fields show_report() prints
+REPORT_COLUMNS = ("dog_name", "rescue_name", "status", "fit_score", "watch_list", "weight", "breed")
+
+
 def show_report():
   """Show summary report of current dogs"""
   dal = get_dal()
@@ -277,7 +279,7 @@ def show_report():
   print("🐕 DOG RESCUE TRACKER - Current Status")
   print("=" * 60)
   
-  all_dogs = dal.get_all_dogs(active_only=True)
+  all_dogs = dal.get_all_dogs(active_only=True, columns=REPORT_COLUMNS)
   
   # Separate by status
   watch_dogs = [d for d in all_dogs if d.watch_list == "Yes"]
@@ -302,12 +304,9 @@ def show_report():
   print(f"\n📋 ALL ACTIVE DOGS ({len(all_dogs)} total)")
   print("-" * 40)
   
-  by_rescue = {}
+  by_rescue = defaultdict(list)
   for dog in all_dogs:
-    rescue = dog.rescue_name
-    if rescue not in by_rescue:
-      by_rescue[rescue] = []
-    by_rescue[rescue].append(dog)
+    by_rescue[dog.rescue_name].append(dog)
   
   for rescue, dogs in by_rescue.items():
     print(f"\n  {rescue} ({len(dogs)} dogs):")
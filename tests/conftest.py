@@ -0,0 +1,18 @@
+"""Shared pytest fixtures: every test runs against a throwaway SQLite file"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dal import DAL  # noqa: E402
+
+
+@pytest.fixture
+def dal(tmp_path):
+  """A DAL with a fresh schema in tmp_path (never the tracked dogs.db)"""
+  dal = DAL(str(tmp_path / "dogs.db"), str(tmp_path / "user_overrides.json"))
+  dal.init_database()
+  yield dal
+  dal.close()
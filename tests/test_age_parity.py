@@ -0,0 +1,53 @@
+"""dal._parse_age_to_years must agree with the dashboard's parseAgeToYears"""
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from dal import _AGE_RANGE_RE, _AGE_SINGLE_RE, _parse_age_to_years
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dashboard_template.html")
+
+AGE_STRINGS = [
+  "2 yrs", "1-3 yrs", "1 – 3 years", "2—4 Years", "8 mos", "6-10 months",
+  "1.5 yr", "10 wks", "12 weeks", "3-4 wks", "Adult", "", "about 2 years old",
+]
+
+
+def _template():
+  with open(TEMPLATE, encoding="utf-8") as f:
+    return f.read()
+
+
+def _js_regex(name: str) -> str:
+  match = re.search(rf"const {name} = /(.*)/[a-z]*;", _template())
+  assert match, f"{name} not found in dashboard_template.html"
+  return match.group(1)
+
+
+def test_client_regexes_match_dal():
+  assert _js_regex("AGE_RANGE_RE") == _AGE_RANGE_RE.pattern
+  assert _js_regex("AGE_SINGLE_RE") == _AGE_SINGLE_RE.pattern
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_client_parse_matches_dal():
+  # The regex constants plus parseAgeToYears/parseAgeUncached, run as-is
+  source = _template()
+  start = source.index("const ageYearsCache")
+  end = source.index("function openEdit")
+  script = source[start:end] + (
+    f"console.log(JSON.stringify({json.dumps(AGE_STRINGS)}.map(parseAgeToYears)));"
+  )
+  result = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True)
+  client = json.loads(result.stdout)
+  
+  for age, years in zip(AGE_STRINGS, client):
+    expected = _parse_age_to_years(age)
+    if expected is None:
+      assert years is None, age
+    else:
+      assert years == pytest.approx(expected), age
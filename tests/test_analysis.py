@@ -0,0 +1,98 @@
+"""Analytics snapshot cache: opt-in, and invalidated by data changes"""
+import json
+import os
+import sqlite3
+
+import pytest
+
+import analysis
+import database
+
+
+@pytest.fixture
+def analytics_db(tmp_path, monkeypatch):
+  """Point database/analysis at a seeded temp DB and a temp cache file"""
+  db_file = str(tmp_path / "dogs.db")
+  monkeypatch.setattr(database, "DB_FILE", db_file)
+  monkeypatch.setattr(database, "_initialized_db", None)
+  monkeypatch.setattr(analysis, "ANALYTICS_CACHE_FILE", str(tmp_path / "cache" / "analytics.json"))
+  database.close_read_connection()
+  database.init_database()
+  
+  conn = sqlite3.connect(db_file)
+  conn.executemany(
+    "INSERT INTO dogs (dog_id, dog_name, rescue_name, status, fit_score, is_active) VALUES (?, ?, ?, ?, ?, 1)",
+    [("a_rex", "Rex", "Rescue A", "Available", 8), ("a_max", "Max", "Rescue A", "Pending", 5)]
+  )
+  conn.execute(
+    "INSERT INTO status_history (dog_id, status, timestamp, days_in_previous_status) VALUES (?, ?, ?, ?)",
+    ("a_max", "Pending", "2026-01-02T00:00:00", 4)
+  )
+  conn.commit()
+  yield conn
+  conn.close()
+  database.close_read_connection()
+
+
+@pytest.fixture
+def query_runs(monkeypatch):
+  """Count how many times the snapshot actually re-ran its queries"""
+  runs = []
+  real = analysis.get_adoption_stats
+  monkeypatch.setattr(analysis, "get_adoption_stats", lambda: runs.append(1) or real())
+  return runs
+
+
+def test_cache_is_opt_in(analytics_db, query_runs):
+  analysis.compute_analytics_snapshot()
+  analysis.compute_analytics_snapshot()
+  
+  assert len(query_runs) == 2
+  assert not os.path.exists(analysis.ANALYTICS_CACHE_FILE)
+
+
+def test_cached_snapshot_is_reused_until_data_changes(analytics_db, query_runs):
+  first = analysis.compute_analytics_snapshot(use_cache=True)
+  again = analysis.compute_analytics_snapshot(use_cache=True)
+  assert len(query_runs) == 1
+  assert again['rescue_performance'] == first['rescue_performance']
+  
+  # A rescore keeps every count the same but must still invalidate
+  analytics_db.execute("UPDATE dogs SET fit_score = 9 WHERE dog_id = 'a_rex'")
+  analytics_db.commit()
+  analysis.compute_analytics_snapshot(use_cache=True)
+  assert len(query_runs) == 2
+  
+  analytics_db.execute("UPDATE dogs SET status = 'Adopted/Removed', is_active = 0 WHERE dog_id = 'a_rex'")
+  analytics_db.commit()
+  analysis.compute_analytics_snapshot(use_cache=True)
+  assert len(query_runs) == 3
+  
+  analytics_db.execute(
+    "INSERT INTO status_history (dog_id, status, timestamp, days_in_previous_status) VALUES (?, ?, ?, ?)",
+    ("a_rex", "Adopted/Removed", "2026-01-05T00:00:00", 3)
+  )
+  analytics_db.commit()
+  analysis.compute_analytics_snapshot(use_cache=True)
+  assert len(query_runs) == 4
+
+
+def test_invalidate_forces_recompute(analytics_db, query_runs):
+  analysis.compute_analytics_snapshot(use_cache=True)
+  analysis.invalidate_analytics_snapshot()
+  analysis.invalidate_analytics_snapshot()  # missing file is fine
+  analysis.compute_analytics_snapshot(use_cache=True)
+  
+  assert len(query_runs) == 2
+
+
+def test_snapshot_json_round_trip_keeps_none_rescue():
+  snapshot = {
+    'key': [], 'created_at': 0, 'progressions': {}, 'insights': {},
+    'adoption_stats': {'by_rescue': {None: {'avg_days': 2.0, 'count': 1}, 'Rescue A': {'avg_days': 4.0, 'count': 1}}},
+    'rescue_performance': {None: {'available': 1}, 'Rescue A': {'available': 2}},
+  }
+  
+  stored = json.loads(json.dumps(analysis._snapshot_to_json(snapshot)))
+  
+  assert analysis._snapshot_from_json(stored) == snapshot
@@ -0,0 +1,98 @@
+"""DAL write paths: touch vs. full upsert, and marking missing dogs inactive"""
+from dal import TOUCH_DOG_SQL
+from schema import Dog
+
+
+def make_dog(dog_id="r_rex", rescue_name="Rescue A", **fields):
+  fields.setdefault("dog_name", dog_id.split("_", 1)[-1].title())
+  fields.setdefault("breed", "Poodle Mix")
+  fields.setdefault("status", "Available")
+  fields.setdefault("age_display", "2 yrs")
+  return Dog(dog_id=dog_id, rescue_name=rescue_name, **fields)
+
+
+def row(dal, dog_id):
+  with dal._get_connection() as conn:
+    return dict(conn.execute("SELECT * FROM dogs WHERE dog_id = ?", (dog_id,)).fetchone())
+
+
+def traced_save(dal, dogs):
+  """save_dogs_bulk, returning (events, whether TOUCH_DOG_SQL ran, SQL executed)"""
+  statements = []
+  conn = dal._thread_connection()
+  conn.set_trace_callback(statements.append)
+  try:
+    events = dal.save_dogs_bulk(dogs)
+  finally:
+    conn.set_trace_callback(None)
+  # The trace callback sees statements with their parameters bound
+  touch_prefix = TOUCH_DOG_SQL.split("?")[0]
+  return events, any(sql.startswith(touch_prefix) for sql in statements), statements
+
+
+def test_unchanged_dog_is_only_touched(dal):
+  dal.save_dogs_bulk([make_dog()])
+  before = row(dal, "r_rex")
+  
+  events, touched, statements = traced_save(dal, [make_dog()])
+  
+  assert events == []
+  assert touched
+  assert not any("INSERT INTO dogs" in sql for sql in statements)
+  after = row(dal, "r_rex")
+  assert after["date_last_updated"] >= before["date_last_updated"]
+  assert {k: v for k, v in after.items() if k != "date_last_updated"} == \
+    {k: v for k, v in before.items() if k != "date_last_updated"}
+
+
+def test_changed_dog_is_updated_with_events(dal):
+  dal.save_dogs_bulk([make_dog()])
+  
+  events, touched, _ = traced_save(dal, [make_dog(weight=30, breed="Labradoodle", status="Pending")])
+  
+  assert not touched
+  assert {e.event_type for e in events} == {"status_change", "website_update"}
+  stored = row(dal, "r_rex")
+  assert stored["weight"] == 30
+  assert stored["breed"] == "Labradoodle"
+  assert stored["status"] == "Pending"
+
+
+def test_inactive_dog_seen_again_is_reactivated(dal):
+  dal.save_dogs_bulk([make_dog(), make_dog("r_max")])
+  dal.mark_dogs_inactive(["r_max"], "Rescue A")
+  assert row(dal, "r_rex")["is_active"] == 0
+  
+  _, touched, _ = traced_save(dal, [make_dog()])
+  
+  assert not touched
+  assert row(dal, "r_rex")["is_active"] == 1
+
+
+def test_mark_dogs_inactive_only_hits_missing_dogs_of_that_rescue(dal):
+  dal.save_dogs_bulk([
+    make_dog("a_one"), make_dog("a_two"), make_dog("a_three"),
+    make_dog("b_one", rescue_name="Rescue B"),
+  ])
+  # Far more IDs than SQLite's bound-parameter limit
+  scraped = ["a_one"] + [f"a_gone_{i}" for i in range(40000)]
+  
+  events = dal.mark_dogs_inactive(scraped, "Rescue A")
+  
+  assert sorted(e.dog_id for e in events) == ["a_three", "a_two"]
+  assert all(e.new_value == "Adopted/Removed" for e in events)
+  for dog_id in ("a_two", "a_three"):
+    stored = row(dal, dog_id)
+    assert stored["is_active"] == 0
+    assert stored["status"] == "Adopted/Removed"
+    assert stored["date_went_unavailable"]
+  assert row(dal, "a_one")["is_active"] == 1
+  assert row(dal, "b_one")["is_active"] == 1
+  assert len(dal.get_dog_events("a_two")) == 2
+
+
+def test_mark_dogs_inactive_ignores_empty_scrape(dal):
+  dal.save_dogs_bulk([make_dog()])
+  
+  assert dal.mark_dogs_inactive([], "Rescue A") == []
+  assert row(dal, "r_rex")["is_active"] == 1